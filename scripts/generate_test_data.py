@@ -8,18 +8,34 @@ Creates 3 example catalogues with 1000 events each:
 
 By default, 60-80% of events are intentionally invalid to stress-test
 validation, error reporting, and data quality assessment.
+
+Event fields are drawn in batches with NumPy, so NumPy must be installed.
+If orjson is available it is used to write the JSON output faster.
+Output is compact JSON; set PRETTY=1 to write it indented for reading.
 """
 
 import json
+import os
 import random
-import math
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 
-# Seed for reproducibility
-random.seed(42)
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # fall back to the standard library json module
+    orjson = None
+
+# Root seed for reproducibility; each catalogue gets its own independent
+# stream spawned from it
+SEED = 42
 
 INVALID_RATIO_RANGE = (0.6, 0.8)
 CROSS_FIELD_ANOMALY_RATIO = 0.15
+# Gutenberg-Richter b-value used for generated magnitudes; 2.5 gives a
+# realistic distribution with some large events
+GR_B_VALUE = 2.5
 
 INVALID_CASES = [
     "missing_time",
@@ -34,11 +50,14 @@ INVALID_CASES = [
     "future_timestamp",
 ]
 
-def introduce_invalid_event(event, event_datetime):
+def introduce_invalid_event(event, start, event_time, rand):
     """
     Mutate event data to create a variety of validation failures.
+
+    ``event_time`` is the event's offset from ``start`` in seconds and
+    ``rand`` is the ``random.Random`` instance to draw from.
     """
-    case = random.choice(INVALID_CASES)
+    case = rand.choice(INVALID_CASES)
 
     if case == "missing_time":
         event.pop("time", None)
@@ -49,103 +68,120 @@ def introduce_invalid_event(event, event_datetime):
     elif case == "missing_magnitude":
         event.pop("magnitude", None)
     elif case == "out_of_range_coords":
-        event["latitude"] = random.choice([95, -95, 120])
-        event["longitude"] = random.choice([190, -190, 250])
+        event["latitude"] = rand.choice([95, -95, 120])
+        event["longitude"] = rand.choice([190, -190, 250])
     elif case == "out_of_range_magnitude":
-        event["magnitude"] = random.choice([11.5, -4.0, 12.0])
+        event["magnitude"] = rand.choice([11.5, -4.0, 12.0])
     elif case == "out_of_range_depth":
-        event["depth"] = random.choice([-10.0, -50.0, 1500.0])
+        event["depth"] = rand.choice([-10.0, -50.0, 1500.0])
     elif case == "invalid_timestamp":
-        event["time"] = random.choice([
+        event["time"] = rand.choice([
             "not-a-date",
             "2024-13-40T25:61:00Z",
             "2024/99/99",
         ])
     elif case == "invalid_types":
-        field = random.choice(["latitude", "longitude", "magnitude", "depth", "time"])
-        event[field] = random.choice(["invalid", "NaN", {"bad": True}])
+        field = rand.choice(["latitude", "longitude", "magnitude", "depth", "time"])
+        event[field] = rand.choice(["invalid", "NaN", {"bad": True}])
     elif case == "future_timestamp":
-        future = event_datetime + timedelta(days=random.randint(365, 3650))
+        event_datetime = start + timedelta(seconds=event_time)
+        future = event_datetime + timedelta(days=rand.randrange(365, 3651))
         event["time"] = future.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
 
     event["validation_note"] = f"invalid:{case}"
     return event
 
-def introduce_cross_field_anomaly(event):
+def introduce_cross_field_anomaly(event, rand):
     """
     Keep event valid but create cross-field inconsistencies for QA checks.
     """
-    event["depth"] = round(random.uniform(0.1, 4.9), 1)
-    event["magnitude"] = round(random.uniform(8.1, 9.6), 1)
+    event["depth"] = round(rand.uniform(0.1, 4.9), 1)
+    event["magnitude"] = round(rand.uniform(8.1, 9.6), 1)
     event["validation_note"] = "anomaly:shallow_large_magnitude"
     return event
 
-def gutenberg_richter_magnitude(min_mag=1.0, max_mag=7.5, b_value=1.0):
+def gutenberg_richter_magnitudes(rng, size, min_mag=1.0, max_mag=7.5, b_value=1.0):
     """
-    Generate magnitude following Gutenberg-Richter law.
+    Generate an array of magnitudes following Gutenberg-Richter law.
     More small earthquakes, fewer large ones.
     """
     # Use power law distribution: N(M) = 10^(a - b*M)
-    # Generate uniform random number and transform
-    u = random.random()
+    # Generate uniform random numbers and transform in place; the exponent
+    # is computed once and applied as a single array operation
+    u = rng.random(size)
+    np.power(u, 1.0 / b_value, out=u)
     # Adjust to get more events across the full range
-    mag = min_mag + (max_mag - min_mag) * (1 - u**(1/b_value))
-    return round(mag, 1)
+    mags = min_mag + (max_mag - min_mag) * (1 - u)
+    return np.round(mags, 1, out=mags)
+
+# Inclusive dip and rake ranges per tectonic setting. When several rake
+# ranges are listed, each mechanism picks one of them with equal odds.
+FOCAL_MECHANISM_RANGES = {
+    # Thrust faulting common in subduction zones
+    "subduction": {"dip": (20, 50), "rake": [(70, 110)]},  # Reverse/thrust
+    # Strike-slip faulting, left- or right-lateral
+    "strike_slip": {"dip": (70, 90), "rake": [(-20, 20), (160, 200)]},
+    # Normal faulting
+    "normal": {"dip": (40, 70), "rake": [(-110, -70)]},
+}
 
-def generate_focal_mechanism(region_type="subduction"):
+def generate_focal_mechanisms(rng, count, region_type="subduction"):
     """
-    Generate realistic focal mechanism based on tectonic setting.
+    Generate a list of realistic focal mechanisms based on tectonic setting.
+    Unknown settings fall back to normal faulting.
     """
-    if region_type == "subduction":
-        # Thrust faulting common in subduction zones
-        strike = random.randint(0, 360)
-        dip = random.randint(20, 50)
-        rake = random.randint(70, 110)  # Reverse/thrust
-    elif region_type == "strike_slip":
-        # Strike-slip faulting
-        strike = random.randint(0, 360)
-        dip = random.randint(70, 90)
-        rake = random.choice([random.randint(-20, 20), random.randint(160, 200)])
-    else:  # normal faulting
-        strike = random.randint(0, 360)
-        dip = random.randint(40, 70)
-        rake = random.randint(-110, -70)
-    
+    ranges = FOCAL_MECHANISM_RANGES.get(region_type, FOCAL_MECHANISM_RANGES["normal"])
+    dip_low, dip_high = ranges["dip"]
+    rake_lows, rake_highs = np.array(ranges["rake"]).T
+
+    strikes = rng.integers(0, 360, count, endpoint=True)
+    dips = rng.integers(dip_low, dip_high, count, endpoint=True)
+    if len(rake_lows) == 1:
+        rakes = rng.integers(rake_lows[0], rake_highs[0], count, endpoint=True)
+    else:
+        choice = rng.integers(0, len(rake_lows), count)
+        rakes = rng.integers(rake_lows[choice], rake_highs[choice], endpoint=True)
+
     # Calculate auxiliary plane (simplified)
-    strike2 = (strike + 180) % 360
-    dip2 = dip
-    rake2 = -rake
-    
-    return {
-        "nodalPlane1": {
-            "strike": strike,
-            "dip": dip,
-            "rake": rake
-        },
-        "nodalPlane2": {
-            "strike": strike2,
-            "dip": dip2,
-            "rake": rake2
+    strikes2 = (strikes + 180) % 360
+    rakes2 = -rakes
+
+    return [
+        {
+            "nodalPlane1": {
+                "strike": strike,
+                "dip": dip,
+                "rake": rake
+            },
+            "nodalPlane2": {
+                "strike": strike2,
+                "dip": dip,
+                "rake": rake2
+            }
         }
-    }
+        for strike, dip, rake, strike2, rake2 in zip(
+            strikes.tolist(), dips.tolist(), rakes.tolist(),
+            strikes2.tolist(), rakes2.tolist()
+        )
+    ]
 
-def generate_depth(region_type="shallow", magnitude=3.0):
+def generate_depths(rng, magnitudes, region_type="shallow"):
     """
-    Generate realistic depth based on region and magnitude.
+    Generate an array of realistic depths based on region and magnitude.
     """
+    size = len(magnitudes)
     if region_type == "shallow":
-        # Most earthquakes are shallow
-        if magnitude < 4.0:
-            return round(random.uniform(5, 25), 1)
-        else:
-            return round(random.uniform(10, 40), 1)
+        # Most earthquakes are shallow; draw once with per-event bounds
+        small = magnitudes < 4.0
+        depths = rng.uniform(np.where(small, 5, 10), np.where(small, 25, 40))
     elif region_type == "intermediate":
         # Some deeper events
-        return round(random.uniform(20, 150), 1)
+        depths = rng.uniform(20, 150, size)
     else:  # deep
-        return round(random.uniform(100, 600), 1)
+        depths = rng.uniform(100, 600, size)
+    return np.round(depths, 1, out=depths)
 
-def generate_catalogue(name, region, bounds, num_events=1000, 
+def generate_catalogue(name, region, bounds, rng, num_events=1000,
                       start_date="2024-01-01", end_date="2024-10-29",
                       tectonic_type="subduction", depth_type="shallow",
                       invalid_ratio=None, invalid_ratio_range=INVALID_RATIO_RANGE,
@@ -157,68 +193,100 @@ def generate_catalogue(name, region, bounds, num_events=1000,
     end = datetime.fromisoformat(end_date)
     time_range = (end - start).total_seconds()
     
+    # Instance-local stdlib RNG for the invalid/anomaly mutations, seeded
+    # from rng so the whole catalogue is reproducible from rng alone
+    rand = random.Random(int(rng.integers(2**63)))
+
     events = []
     if invalid_ratio is None:
-        invalid_ratio = random.uniform(*invalid_ratio_range)
+        invalid_ratio = float(rng.uniform(*invalid_ratio_range))
     invalid_ratio = max(0, min(1, invalid_ratio))
     invalid_count = int(num_events * invalid_ratio)
-    invalid_indices = set(random.sample(range(num_events), invalid_count))
-    
+    invalid_indices = rng.choice(num_events, size=invalid_count, replace=False)
+    invalid_mask = np.zeros(num_events, dtype=bool)
+    invalid_mask[invalid_indices] = True
+
+    # Draw every numeric field up front as vectors; the loop below only
+    # assembles dicts from the precomputed values.
+
+    # Generate magnitudes (Gutenberg-Richter distribution)
+    mags = gutenberg_richter_magnitudes(rng, num_events, min_mag=1.0, max_mag=7.5, b_value=GR_B_VALUE)
+
+    # Generate times (random but clustered - earthquakes cluster in time)
+    times = rng.uniform(0, time_range, num_events)
+    cluster = rng.random(num_events) < 0.3  # 30% chance of being in a cluster
+    times[cluster] += rng.uniform(-86400, 86400, cluster.sum())  # ±1 day
+
+    # Generate locations within bounds
+    lats = np.round(rng.uniform(bounds["minLatitude"], bounds["maxLatitude"], num_events), 4)
+    lons = np.round(rng.uniform(bounds["minLongitude"], bounds["maxLongitude"], num_events), 4)
+
+    # Generate depths
+    depths = generate_depths(rng, mags, depth_type)
+
+    anomalies = rng.random(num_events) < anomaly_ratio
+
+    # Focal mechanisms for M >= 5.0, consumed in event order by the loop
+    focal_count = int((mags >= 5.0).sum())
+    focal_mechanisms = iter(generate_focal_mechanisms(rng, focal_count, tectonic_type))
+
+    # Format all timestamps in one vectorised call (ISO 8601, ms, "Z" suffix).
+    # Round to microseconds first, as timedelta does, then truncate to ms.
+    event_datetimes64 = np.datetime64(start) + np.round(times * 1e6).astype("timedelta64[us]")
+    time_strings = np.datetime_as_string(event_datetimes64, unit="ms", timezone="UTC").tolist()
+
+    # Convert to Python scalars once so the events serialise as plain JSON
+    magnitudes = mags.tolist()
+    event_times = times.tolist()
+    latitudes = lats.tolist()
+    longitudes = lons.tolist()
+    event_depths = depths.tolist()
+    is_anomaly = anomalies.tolist()
+    is_invalid = invalid_mask.tolist()
+
+    id_prefix = f"{region.lower().replace(' ', '_')}_{start.year}p"
+    mag_min = mag_max = None
+
+    # Bind loop-invariant callables locally to skip global/attribute lookups
+    add_event = events.append
+    make_invalid = introduce_invalid_event
+    make_anomaly = introduce_cross_field_anomaly
+
     for i in range(num_events):
-        # Generate magnitude (Gutenberg-Richter distribution)
-        # Use b_value=2.5 to get more realistic distribution with some large events
-        magnitude = gutenberg_richter_magnitude(min_mag=1.0, max_mag=7.5, b_value=2.5)
-        
-        # Generate time (random but clustered - earthquakes cluster in time)
-        if random.random() < 0.3:  # 30% chance of being in a cluster
-            # Pick a random cluster time
-            cluster_time = random.uniform(0, time_range)
-            # Add small offset for cluster
-            event_time = cluster_time + random.uniform(-86400, 86400)  # ±1 day
-        else:
-            event_time = random.uniform(0, time_range)
-        
-        event_datetime = start + timedelta(seconds=event_time)
-        
-        # Generate location within bounds
-        lat = random.uniform(bounds["minLatitude"], bounds["maxLatitude"])
-        lon = random.uniform(bounds["minLongitude"], bounds["maxLongitude"])
-        
-        # Generate depth
-        depth = generate_depth(depth_type, magnitude)
-        
-        # Create event
+        magnitude = magnitudes[i]
+
+        # Create event (a dict literal is faster than dict(zip(keys, values)))
         event = {
-            "publicID": f"{region.lower().replace(' ', '_')}_{start.year}p{i+1:06d}",
-            "time": event_datetime.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z",
-            "latitude": round(lat, 4),
-            "longitude": round(lon, 4),
-            "depth": depth,
+            "publicID": f"{id_prefix}{i+1:06d}",
+            "time": time_strings[i],
+            "latitude": latitudes[i],
+            "longitude": longitudes[i],
+            "depth": event_depths[i],
             "magnitude": magnitude
         }
-        
+
         # Add focal mechanism for M >= 5.0
         if magnitude >= 5.0:
-            event["focal_mechanisms"] = [generate_focal_mechanism(tectonic_type)]
-        if i in invalid_indices:
-            introduce_invalid_event(event, event_datetime)
-        elif random.random() < anomaly_ratio:
-            introduce_cross_field_anomaly(event)
+            event["focal_mechanisms"] = [next(focal_mechanisms)]
+        if is_invalid[i]:
+            make_invalid(event, start, event_times[i], rand)
+        elif is_anomaly[i]:
+            make_anomaly(event, rand)
 
-        events.append(event)
-    
-    # Sort by time
-    events.sort(key=lambda x: x.get("time") or "")
+        # Track the range of numeric magnitudes left after mutation
+        final_magnitude = event.get("magnitude")
+        if isinstance(final_magnitude, (int, float)):
+            if mag_min is None or final_magnitude < mag_min:
+                mag_min = final_magnitude
+            if mag_max is None or final_magnitude > mag_max:
+                mag_max = final_magnitude
+
+        add_event(event)
+
+    # Sort by the generated event time; invalid events keep their original
+    # position even though their "time" field may be missing or malformed
+    events = [events[i] for i in np.argsort(times, kind="stable").tolist()]
 
-    numeric_magnitudes = [
-        e["magnitude"] for e in events
-        if isinstance(e.get("magnitude"), (int, float))
-    ]
-    magnitude_range = {
-        "min": min(numeric_magnitudes) if numeric_magnitudes else None,
-        "max": max(numeric_magnitudes) if numeric_magnitudes else None
-    }
-    
     catalogue = {
         "catalogue_name": name,
         "region": region,
@@ -232,92 +300,132 @@ def generate_catalogue(name, region, bounds, num_events=1000,
             "total_events": num_events,
             "invalid_events": invalid_count,
             "invalid_ratio": round(invalid_ratio, 2),
-            "events_with_focal_mechanisms": sum(1 for e in events if "focal_mechanisms" in e),
-            "magnitude_range": magnitude_range
+            "events_with_focal_mechanisms": focal_count,
+            "magnitude_range": {
+                "min": mag_min,
+                "max": mag_max
+            }
         },
         "events": events
     }
     
     return catalogue
 
-# Generate 3 example catalogues for New Zealand regions
-
-# 1. North Island catalogue
-print("Generating North Island catalogue...")
-north_island_catalogue = generate_catalogue(
-    name="North Island Seismic Events",
-    region="New Zealand - North Island",
-    bounds={
-        "minLatitude": -41.5,
-        "maxLatitude": -34.0,
-        "minLongitude": 172.0,
-        "maxLongitude": 179.0
-    },
-    num_events=1000,
-    tectonic_type="subduction",
-    depth_type="shallow"
-)
-
-# 2. South Island catalogue
-print("Generating South Island catalogue...")
-south_island_catalogue = generate_catalogue(
-    name="South Island Seismic Events",
-    region="New Zealand - South Island",
-    bounds={
-        "minLatitude": -47.0,
-        "maxLatitude": -40.5,
-        "minLongitude": 166.0,
-        "maxLongitude": 174.5
-    },
-    num_events=1000,
-    tectonic_type="strike_slip",
-    depth_type="shallow"
-)
-
-# 3. Deep events catalogue
-print("Generating Deep Events catalogue...")
-deep_events_catalogue = generate_catalogue(
-    name="NZ Deep Seismic Events",
-    region="New Zealand - Deep Events",
-    bounds={
-        "minLatitude": -47.0,
-        "maxLatitude": -34.0,
-        "minLongitude": 166.0,
-        "maxLongitude": 179.0
-    },
-    num_events=1000,
-    tectonic_type="subduction",
-    depth_type="deep"
-)
-
-# Save catalogues
-print("\nSaving catalogues to JSON files...")
-with open("test-data/north-island-catalogue.json", "w") as f:
-    json.dump(north_island_catalogue, f, indent=2)
-print("✓ Saved: test-data/north-island-catalogue.json")
-
-with open("test-data/south-island-catalogue.json", "w") as f:
-    json.dump(south_island_catalogue, f, indent=2)
-print("✓ Saved: test-data/south-island-catalogue.json")
-
-with open("test-data/deep-events-catalogue.json", "w") as f:
-    json.dump(deep_events_catalogue, f, indent=2)
-print("✓ Saved: test-data/deep-events-catalogue.json")
-
-print("\n" + "="*60)
-print("SUMMARY")
-print("="*60)
-for cat in [north_island_catalogue, south_island_catalogue, deep_events_catalogue]:
-    print(f"\n{cat['catalogue_name']}:")
-    print(f"  Region: {cat['region']}")
-    print(f"  Total events: {cat['statistics']['total_events']}")
-    print(f"  Invalid events: {cat['statistics']['invalid_events']} ({cat['statistics']['invalid_ratio'] * 100:.0f}%)")
-    print(f"  Events with focal mechanisms: {cat['statistics']['events_with_focal_mechanisms']}")
-    print(f"  Magnitude range: {cat['statistics']['magnitude_range']['min']} - {cat['statistics']['magnitude_range']['max']}")
-    print(f"  Geographic bounds:")
-    print(f"    Latitude: {cat['geographic_bounds']['minLatitude']} to {cat['geographic_bounds']['maxLatitude']}")
-    print(f"    Longitude: {cat['geographic_bounds']['minLongitude']} to {cat['geographic_bounds']['maxLongitude']}")
-
-print("\n" + "="*60)
-print("3 example catalogues generated successfully!")
-print("="*60)
+# Example catalogues for New Zealand regions, with their output files
+CATALOGUES = [
+    # 1. North Island catalogue
+    ("test-data/north-island-catalogue.json", {
+        "name": "North Island Seismic Events",
+        "region": "New Zealand - North Island",
+        "bounds": {
+            "minLatitude": -41.5,
+            "maxLatitude": -34.0,
+            "minLongitude": 172.0,
+            "maxLongitude": 179.0
+        },
+        "num_events": 1000,
+        "tectonic_type": "subduction",
+        "depth_type": "shallow"
+    }),
+    # 2. South Island catalogue
+    ("test-data/south-island-catalogue.json", {
+        "name": "South Island Seismic Events",
+        "region": "New Zealand - South Island",
+        "bounds": {
+            "minLatitude": -47.0,
+            "maxLatitude": -40.5,
+            "minLongitude": 166.0,
+            "maxLongitude": 174.5
+        },
+        "num_events": 1000,
+        "tectonic_type": "strike_slip",
+        "depth_type": "shallow"
+    }),
+    # 3. Deep events catalogue
+    ("test-data/deep-events-catalogue.json", {
+        "name": "NZ Deep Seismic Events",
+        "region": "New Zealand - Deep Events",
+        "bounds": {
+            "minLatitude": -47.0,
+            "maxLatitude": -34.0,
+            "minLongitude": 166.0,
+            "maxLongitude": 179.0
+        },
+        "num_events": 1000,
+        "tectonic_type": "subduction",
+        "depth_type": "deep"
+    }),
+]
+
+def write_catalogue(path, catalogue, pretty=False):
+    """
+    Write a catalogue to disk as compact JSON, or indented if ``pretty``.
+    """
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(catalogue, option=orjson.OPT_INDENT_2 if pretty else 0))
+    else:
+        with open(path, "w") as f:
+            if pretty:
+                json.dump(catalogue, f, indent=2)
+            else:
+                json.dump(catalogue, f, separators=(",", ":"))
+
+def generate_catalogue_worker(job):
+    """
+    Generate one catalogue in a worker process with an RNG seeded from its
+    spawned ``SeedSequence``.
+    """
+    seed_sequence, params = job
+    return generate_catalogue(rng=np.random.default_rng(seed_sequence), **params)
+
+def main(catalogues_config=CATALOGUES):
+    """
+    Generate, save and summarise catalogues.
+
+    ``catalogues_config`` is a list of (output path, generate_catalogue
+    keyword arguments) pairs, in the same shape as ``CATALOGUES``.
+    """
+    if not catalogues_config:
+        print("No catalogues to generate.")
+        return
+
+    # The catalogues are independent, so generate them concurrently, each
+    # from its own child of the root seed
+    seed_sequences = np.random.SeedSequence(SEED).spawn(len(catalogues_config))
+    for _, params in catalogues_config:
+        print(f"Generating {params['name']} catalogue...")
+    max_workers = min(len(catalogues_config), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        catalogues = list(executor.map(
+            generate_catalogue_worker,
+            zip(seed_sequences, (params for _, params in catalogues_config))
+        ))
+
+    # Save catalogues
+    pretty = os.environ.get("PRETTY") == "1"
+    print("\nSaving catalogues to JSON files...")
+    for (path, _), catalogue in zip(catalogues_config, catalogues):
+        write_catalogue(path, catalogue, pretty)
+        print(f"✓ Saved: {path}")
+
+    print("\n" + "="*60)
+    print("SUMMARY")
+    print("="*60)
+    for cat in catalogues:
+        print(f"\n{cat['catalogue_name']}:")
+        print(f"  Region: {cat['region']}")
+        print(f"  Total events: {cat['statistics']['total_events']}")
+        print(f"  Invalid events: {cat['statistics']['invalid_events']} ({cat['statistics']['invalid_ratio'] * 100:.0f}%)")
+        print(f"  Events with focal mechanisms: {cat['statistics']['events_with_focal_mechanisms']}")
+        print(f"  Magnitude range: {cat['statistics']['magnitude_range']['min']} - {cat['statistics']['magnitude_range']['max']}")
+        print(f"  Geographic bounds:")
+        print(f"    Latitude: {cat['geographic_bounds']['minLatitude']} to {cat['geographic_bounds']['maxLatitude']}")
+        print(f"    Longitude: {cat['geographic_bounds']['minLongitude']} to {cat['geographic_bounds']['maxLongitude']}")
+
+    print("\n" + "="*60)
+    print(f"{len(catalogues)} example catalogues generated successfully!")
+    print("="*60)
+
+if __name__ == "__main__":
+    main()